@@ -18,25 +18,45 @@ logger = logging.getLogger(__name__)
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_debug_logging_for_tests() -> None:
+    # Debug logging is very noisy and slows down the tests considerably so it
+    # must be explicitly enabled
+    if not os.environ.get("DAGSTER_SQLMESH_TEST_DEBUG"):
+        return
+
     root_logger = logging.getLogger(__name__.split(".")[0])
     root_logger.setLevel(logging.DEBUG)
 
     logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 
 
-@pytest.fixture
-def sample_sqlmesh_project() -> t.Iterator[str]:
-    """Creates a temporary sqlmesh project by copying the sample project"""
+@pytest.fixture(scope="session")
+def _sample_project_template() -> t.Iterator[str]:
+    """Copies the sample sqlmesh project once per session. Any local state
+    (databases, logs and caches) is left out of the copy"""
     with tempfile.TemporaryDirectory() as tmp_dir:
-        project_dir = shutil.copytree(
-            "sample/sqlmesh_project", os.path.join(tmp_dir, "project")
+        template_dir = shutil.copytree(
+            "sample/sqlmesh_project",
+            os.path.join(tmp_dir, "project"),
+            ignore=shutil.ignore_patterns("*.db", "*.db.wal", "logs", ".cache"),
         )
-        db_path = os.path.join(project_dir, "db.db")
-        if os.path.exists(db_path):
-            os.remove(os.path.join(project_dir, "db.db"))
+        yield str(template_dir)
+
+
+@pytest.fixture
+def sample_sqlmesh_project(_sample_project_template: str) -> t.Iterator[str]:
+    """Creates a temporary sqlmesh project that links to the session's copy of
+    the sample project. Only the database, logs and caches are local to each
+    test"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_dir = os.path.join(tmp_dir, "project")
+        os.mkdir(project_dir)
+        for entry in os.listdir(_sample_project_template):
+            os.symlink(
+                os.path.join(_sample_project_template, entry),
+                os.path.join(project_dir, entry),
+            )
 
-        # Initialize the "source" data
-        yield str(project_dir)
+        yield project_dir
 
 @pytest.fixture
 def sample_sqlmesh_db_path(sample_sqlmesh_project: str) -> t.Iterator[str]:
@@ -52,5 +72,8 @@ def sample_sqlmesh_test_context(
     sample_sqlmesh_project: str, sample_sqlmesh_test_context_config: SQLMeshContextConfig, sample_sqlmesh_db_path: str
 ) -> t.Iterator[SQLMeshTestContext]:
     test_context = SQLMeshTestContext(db_path=sample_sqlmesh_db_path, context_config=sample_sqlmesh_test_context_config)
-    test_context.initialize_test_source()
-    yield test_context
+    try:
+        test_context.initialize_test_source()
+        yield test_context
+    finally:
+        test_context.close()
@@ -404,13 +404,16 @@ class IntrospectingConsole(Console):
         self.publish(event)
 
     def publish(self, event: ConsoleEvent) -> None:
-        self.logger.debug(
-            f"EventConsole[{self.id}]: sending event {event.__class__.__name__} to {len(self._handlers)}"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"EventConsole[{self.id}]: sending event {event.__class__.__name__} to {len(self._handlers)}"
+            )
         for handler in self._handlers.values():
             handler(event)
 
     def publish_unknown_event(self, event_name: str, **kwargs: t.Any) -> None:
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         self.logger.debug(
             f"EventConsole[{self.id}]: sending unknown '{event_name}' event to {len(self._handlers)} handlers"
         )
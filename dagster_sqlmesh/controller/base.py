@@ -67,7 +67,7 @@ class RunOptions(t.TypedDict):
     no_auto_upstream: t.NotRequired[bool]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class SQLMeshParsedFQN:
     catalog: str
     schema: str
@@ -75,16 +75,14 @@ class SQLMeshParsedFQN:
 
 
 def parse_fqn(fqn: str) -> SQLMeshParsedFQN:
-    split_fqn = fqn.split(".")
-
-    # Remove any quotes
-    split_fqn = list(map(lambda a: a.strip("'\""), split_fqn))
+    # Remove any quotes around each part
+    split_fqn = [part.strip("'\"") for part in fqn.split(".")]
     return SQLMeshParsedFQN(
         catalog=split_fqn[0], schema=split_fqn[1], view_name=split_fqn[2]
     )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class SQLMeshModelDep:
     fqn: str
     model: Model | None = None
@@ -93,6 +91,25 @@ class SQLMeshModelDep:
         return parse_fqn(self.fqn)
 
 
+class ConsoleHandlerContext:
+    """A context manager that adds a handler to the console on enter and
+    removes it on exit. This is entered for every plan and run so it is
+    implemented as a plain class rather than with `contextmanager`."""
+
+    __slots__ = ("_console", "_handler", "_handler_id")
+
+    def __init__(self, console: EventConsole, handler: ConsoleEventHandler) -> None:
+        self._console = console
+        self._handler = handler
+        self._handler_id = ""
+
+    def __enter__(self) -> None:
+        self._handler_id = self._console.add_handler(self._handler)
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._console.remove_handler(self._handler_id)
+
+
 class SQLMeshInstance(t.Generic[ContextCls]):
     """
     A class that manages sqlmesh operations and context within a specific
@@ -132,11 +149,8 @@ class SQLMeshInstance(t.Generic[ContextCls]):
         self.context = context
         self.logger = logger
 
-    @contextmanager
-    def console_context(self, handler: ConsoleEventHandler) -> t.Iterator[None]:
-        id = self.console.add_handler(handler)
-        yield
-        self.console.remove_handler(id)
+    def console_context(self, handler: ConsoleEventHandler) -> ConsoleHandlerContext:
+        return ConsoleHandlerContext(self.console, handler)
 
     def plan(
         self,
@@ -165,83 +179,13 @@ class SQLMeshInstance(t.Generic[ContextCls]):
         Raises:
             ConsoleException: If an error occurs during plan execution.
         """
-
-        context = self.context
-
-        # Runs things in thread
-        def run_sqlmesh_thread(
-            logger: logging.Logger,
-            context: Context,
-            controller: SQLMeshController[ContextCls],
-            environment: str,
-            plan_options: PlanOptions,
-            default_catalog: str,
-        ) -> None:
-            logger.debug("dagster-sqlmesh: thread started")
-
-            def auto_execute_plan(event: ConsoleEvent):
-                if isinstance(event, Plan):
-                    try:
-                        event.plan_builder.apply()
-                    except Exception as e:
-                        controller.console.exception(e)
-                return None
-
-            try:
-                controller.console.add_handler(auto_execute_plan)
-                builder = t.cast(
-                    PlanBuilder,
-                    context.plan_builder(
-                        environment=environment,
-                        **plan_options,
-                    ),
-                )
-                logger.debug("dagster-sqlmesh: plan")
-                controller.console.plan(
-                    builder,
-                    auto_apply=True,
-                    default_catalog=default_catalog,
-                ) 
-            except Exception as e:
-                controller.console.exception(e)
-            except:  # noqa: E722
-                controller.console.exception(Exception("Unknown error during plan"))
-
-        generator = ConsoleGenerator(self.logger)
-
         if categorizer:
             self.console.add_snapshot_categorizer(categorizer)
 
-        with self.console_context(generator):
-            self.logger.debug("starting sqlmesh plan thread")
-            thread = threading.Thread(
-                target=run_sqlmesh_thread,
-                args=(
-                    self.logger,
-                    context,
-                    self,
-                    self.environment,
-                    plan_options,
-                    default_catalog,
-                ),
-            )
-            thread.start()
-
-            self.logger.debug("waiting for events")
-            try:
-                for event in generator.events(thread):
-                    match event:
-                        case ConsoleException(exception=e):
-                            raise e
-                        case _:
-                            yield event
-            except Exception as e:
-                import traceback
-                print("An exception occurred:")
-                print(traceback.format_exc())
-                raise
-
-            thread.join()
+        self.logger.debug("starting sqlmesh plan thread")
+        yield from self._events_from_thread(
+            lambda: self._plan(default_catalog, plan_options)
+        )
 
     def run(self, **run_options: t.Unpack[RunOptions]) -> t.Iterator[ConsoleEvent]:
         """Executes sqlmesh run in a separate thread with console output.
@@ -263,38 +207,113 @@ class SQLMeshInstance(t.Generic[ContextCls]):
             Exception: Re-raises any exception caught during the sqlmesh run in
             the main thread.
         """
+        yield from self._events_from_thread(lambda: self._run(run_options))
+
+    def plan_sync(
+        self,
+        handler: ConsoleEventHandler,
+        categorizer: SnapshotCategorizer | None = None,
+        default_catalog: str | None = None,
+        **plan_options: t.Unpack[PlanOptions],
+    ) -> None:
+        """Executes a sqlmesh plan operation on the calling thread.
+
+        Unlike `plan`, this does not start a separate thread. Console events
+        are passed directly to the given handler as sqlmesh publishes them.
+        This is useful when the caller only records events and never needs to
+        act on them while sqlmesh is running.
+
+        Args:
+            handler (ConsoleEventHandler): Handler that receives all console
+                events generated during plan execution.
+            categorizer (SnapshotCategorizer | None): Categorizer for
+                snapshots. Defaults to None.
+            default_catalog (str | None): Default catalog to use for the
+                plan. Defaults to None.
+            **plan_options (**PlanOptions): Additional options for plan
+                execution.
+
+        Raises:
+            Exception: Any exception raised by sqlmesh during the plan.
+        """
+        if categorizer:
+            self.console.add_snapshot_categorizer(categorizer)
+
+        with self.console_context(handler):
+            self._plan(default_catalog, plan_options)
+
+    def run_sync(
+        self, handler: ConsoleEventHandler, **run_options: t.Unpack[RunOptions]
+    ) -> None:
+        """Executes sqlmesh run on the calling thread.
+
+        Unlike `run`, this does not start a separate thread. Console events are
+        passed directly to the given handler as sqlmesh publishes them.
+
+        Args:
+            handler (ConsoleEventHandler): Handler that receives all console
+                events generated during the run.
+            **run_options (**RunOptions): Additional run options. See the
+                RunOptions type.
+
+        Raises:
+            Exception: Any exception raised by sqlmesh during the run.
+        """
+        with self.console_context(handler):
+            self._run(run_options)
+
+    def _plan(self, default_catalog: str | None, plan_options: PlanOptions) -> None:
+        """Plans and applies on the calling thread. Events go to whichever
+        handlers are registered on the console."""
+
+        def auto_execute_plan(event: ConsoleEvent):
+            if isinstance(event, Plan):
+                event.plan_builder.apply()
+
+        with self.console_context(auto_execute_plan):
+            builder = t.cast(
+                PlanBuilder,
+                self.context.plan_builder(
+                    environment=self.environment,
+                    **plan_options,
+                ),
+            )
+            self.logger.debug("dagster-sqlmesh: plan")
+            self.console.plan(
+                builder,
+                auto_apply=True,
+                default_catalog=default_catalog,
+            )
 
-        # Runs things in thread
-        def run_sqlmesh_thread(
-            logger: logging.Logger,
-            context: Context,
-            controller: SQLMeshController[ContextCls],
-            environment: str,
-            run_options: RunOptions,
-        ) -> None:
-            logger.debug("dagster-sqlmesh: run")
+    def _run(self, run_options: RunOptions) -> None:
+        self.logger.debug("dagster-sqlmesh: run")
+        self.context.run(environment=self.environment, **run_options)
+
+    def _events_from_thread(
+        self, target: t.Callable[[], None]
+    ) -> t.Iterator[ConsoleEvent]:
+        """Calls `target` in a separate thread and yields the console events it
+        publishes. Any exception in the thread is published to the console and
+        re-raised here."""
+        generator = ConsoleGenerator(self.logger)
+
+        def run_sqlmesh_thread() -> None:
+            self.logger.debug("dagster-sqlmesh: thread started")
             try:
-                context.run(environment=environment, **run_options)
+                target()
             except Exception as e:
-                controller.console.exception(e)
+                self.console.exception(e)
             except:  # noqa: E722
-                controller.console.exception(Exception("Unknown error during plan"))
+                self.console.exception(Exception("Unknown error in sqlmesh thread"))
+            finally:
+                generator.finish()
 
-        generator = ConsoleGenerator(self.logger)
         with self.console_context(generator):
-            thread = threading.Thread(
-                target=run_sqlmesh_thread,
-                args=(
-                    self.logger,
-                    self.context,
-                    self,
-                    self.environment,
-                    run_options or {},
-                ),
-            )
+            thread = threading.Thread(target=run_sqlmesh_thread)
             thread.start()
 
-            for event in generator.events(thread):
+            self.logger.debug("waiting for events")
+            for event in generator.events():
                 match event:
                     case ConsoleException(exception=e):
                         raise e
@@ -322,6 +341,82 @@ class SQLMeshInstance(t.Generic[ContextCls]):
         This is an opinionated interface for running a plan and run operation in
         a single thread. It is recommended to use this method for most use cases.
         """
+        plan_options, run_options = self._plan_and_run_options(
+            select_models=select_models,
+            restate_models=restate_models,
+            restate_selected=restate_selected,
+            start=start,
+            end=end,
+            plan_options=plan_options,
+            run_options=run_options,
+        )
+
+        with self._log_plan_and_run(select_models):
+            yield from self.plan(categorizer, default_catalog, **plan_options)
+            if not skip_run:
+                self.logger.debug("starting sqlmesh run")
+                yield from self.run(**run_options)
+
+    def plan_and_run_sync(
+        self,
+        handler: ConsoleEventHandler,
+        *,
+        select_models: list[str] | None = None,
+        restate_models: list[str] | None = None,
+        restate_selected: bool = False,
+        start: TimeLike | None = None,
+        end: TimeLike | None = None,
+        categorizer: SnapshotCategorizer | None = None,
+        default_catalog: str | None = None,
+        plan_options: PlanOptions | None = None,
+        run_options: RunOptions | None = None,
+        skip_run: bool = False,
+    ) -> None:
+        """Executes a plan and run operation on the calling thread
+
+        This accepts the same options as `plan_and_run` but passes all console
+        events to the given handler instead of yielding them.
+        """
+        plan_options, run_options = self._plan_and_run_options(
+            select_models=select_models,
+            restate_models=restate_models,
+            restate_selected=restate_selected,
+            start=start,
+            end=end,
+            plan_options=plan_options,
+            run_options=run_options,
+        )
+
+        with self._log_plan_and_run(select_models):
+            self.plan_sync(handler, categorizer, default_catalog, **plan_options)
+            if not skip_run:
+                self.logger.debug("starting sqlmesh run")
+                self.run_sync(handler, **run_options)
+
+    @contextmanager
+    def _log_plan_and_run(self, select_models: list[str] | None) -> t.Iterator[None]:
+        try:
+            self.logger.debug("starting sqlmesh plan")
+            self.logger.debug(f"selected models: {select_models}")
+            yield
+        except Exception as e:
+            self.logger.error(f"Error during sqlmesh plan and run: {e}")
+            raise e
+        except:
+            self.logger.error("Error during sqlmesh plan and run")
+            raise
+
+    def _plan_and_run_options(
+        self,
+        *,
+        select_models: list[str] | None,
+        restate_models: list[str] | None,
+        restate_selected: bool,
+        start: TimeLike | None,
+        end: TimeLike | None,
+        plan_options: PlanOptions | None,
+        run_options: RunOptions | None,
+    ) -> tuple[PlanOptions, RunOptions]:
         run_options = run_options or RunOptions()
         plan_options = plan_options or PlanOptions()
 
@@ -336,34 +431,23 @@ class SQLMeshInstance(t.Generic[ContextCls]):
         select_models = select_models or []
         restate_models = restate_models or []
 
+        # Collect the options derived from the arguments separately and merge
+        # them in a single step. This never modifies the caller's options so
+        # they can be safely reused across multiple plan and run calls.
+        plan_overrides = PlanOptions()
+        run_overrides = RunOptions()
         if start:
-            plan_options["start"] = start
-            run_options["start"] = start
+            plan_overrides["start"] = run_overrides["start"] = start
         if end:
-            plan_options["end"] = end
-            run_options["end"] = end
+            plan_overrides["end"] = run_overrides["end"] = end
 
         if restate_models:
-            plan_options["restate_models"] = restate_models
+            plan_overrides["restate_models"] = restate_models
         if select_models:
-            plan_options["select_models"] = select_models
-            run_options["select_models"] = select_models
+            plan_overrides["select_models"] = run_overrides["select_models"] = select_models
             if restate_selected:
-                plan_options["restate_models"] = select_models
-        
-        try:
-            self.logger.debug("starting sqlmesh plan")
-            self.logger.debug(f"selected models: {select_models}")
-            yield from self.plan(categorizer, default_catalog, **plan_options)
-            if not skip_run:
-                self.logger.debug("starting sqlmesh run")
-                yield from self.run(**run_options)
-        except Exception as e:
-            self.logger.error(f"Error during sqlmesh plan and run: {e}")
-            raise e
-        except:
-            self.logger.error("Error during sqlmesh plan and run")
-            raise
+                plan_overrides["restate_models"] = select_models
+        return (plan_options | plan_overrides, run_options | run_overrides)
 
     def models(self) -> MappingProxyType[str, Model]:
         return self.context.models
@@ -373,10 +457,13 @@ class SQLMeshInstance(t.Generic[ContextCls]):
 
     def non_external_models_dag(self) -> t.Iterable[tuple[Model, set[str]]]:
         dag = self.context.dag
+        # The dag is keyed by normalized fqns so the models can be looked up
+        # directly. `get_model` would normalize each name again.
+        models = self.context.models
 
         for model_fqn, deps in dag.graph.items():
             logger.debug(f"model found: {model_fqn}")
-            model = self.context.get_model(model_fqn)
+            model = models.get(model_fqn)
             if not model:
                 continue
             yield (model, deps)
@@ -460,7 +547,7 @@ class SQLMeshController(t.Generic[ContextCls]):
         self.console = console
         self.logger = log_override or logger
         self._context_factory = context_factory
-        self._context_open = False
+        self._instance_lock = threading.Lock()
 
     def set_logger(self, logger: logging.Logger) -> None:
         self.logger = logger
@@ -489,11 +576,15 @@ class SQLMeshController(t.Generic[ContextCls]):
         self.logger.info(
             f"Opening sqlmesh instance for env={environment} component={component}"
         )
-        if self._context_open:
+        if not self._instance_lock.acquire(blocking=False):
             raise Exception("Only one sqlmesh instance at a time")
 
-        context = self._create_context()
-        self._context_open = True
+        try:
+            context = self._create_context()
+        except:
+            self._instance_lock.release()
+            raise
+
         try:
             yield SQLMeshInstance(
                 environment, self.console, self.config, context, self.logger
@@ -502,7 +593,7 @@ class SQLMeshController(t.Generic[ContextCls]):
             self.logger.info(
                 f"Closing sqlmesh instance for env={environment} component={component}"
             )
-            self._context_open = False
+            self._instance_lock.release()
             context.close()
 
     def run(
@@ -1,6 +1,5 @@
 import logging
 import queue
-import threading
 from collections.abc import Callable, Iterator
 
 from sqlmesh.core.model import Model
@@ -10,7 +9,6 @@ from sqlmesh.core.snapshot import Snapshot, SnapshotId, SnapshotInfoLike
 from dagster_sqlmesh import console
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 
 def show_plan_summary(
@@ -62,21 +60,27 @@ def show_plan_summary(
 
 
 class ConsoleGenerator:
+    """Hands off console events published on the sqlmesh thread to a
+    generator. The sqlmesh thread must call `finish()` once it is done so that
+    the generator stops waiting for events."""
+
     def __init__(self, log_override: logging.Logger | None = None):
-        self._queue: queue.Queue[console.ConsoleEvent] = queue.Queue()
+        # A `None` in the queue signals that no more events are coming
+        self._queue: queue.Queue[console.ConsoleEvent | None] = queue.Queue()
         self.logger = log_override or logger
 
     def __call__(self, event: console.ConsoleEvent) -> None:
         self._queue.put(event)
 
-    def events(self, thread: threading.Thread) -> Iterator[console.ConsoleEvent]:
-        while thread.is_alive() or not self._queue.empty():
-            try:
-                # Get arguments from the queue with a timeout
-                args = self._queue.get(timeout=0.5)
-                yield args
-            except queue.Empty:
-                continue
+    def finish(self) -> None:
+        self._queue.put(None)
+
+    def events(self) -> Iterator[console.ConsoleEvent]:
+        while True:
+            event = self._queue.get()
+            if event is None:
+                return
+            yield event
 
 
 class ConsoleRecorder:
@@ -95,7 +99,7 @@ class ConsoleRecorder:
         match event:
             case console.StartPlanEvaluation(plan=evaluatable_plan):
                 self.logger.debug("Starting plan evaluation")
-                print(evaluatable_plan.plan_id)
+                self.logger.debug("Plan id: %s", evaluatable_plan.plan_id)
             case console.StartEvaluationProgress(
                 batched_intervals=batches, environment_naming_info=environment_naming_info, default_catalog=default_catalog
             ):
@@ -31,58 +31,90 @@ from .utils import sqlmesh_model_name_to_key
 class MaterializationTracker:
     """Tracks sqlmesh materializations and notifies dagster in the correct
     order. This is necessary because sqlmesh may skip some materializations that
-    have no changes and those will be reported as completed out of order."""
+    have no changes and those will be reported as completed out of order.
+
+    The state of each model is stored in lists indexed by the model's position
+    in the sorted dag so that updates don't need to hash snapshots."""
+
+    __slots__ = (
+        "_batch_count",
+        "_complete",
+        "_current_index",
+        "_expected_batches",
+        "_name_to_index",
+        "_sorted_dag",
+        "_update_status",
+        "finished_promotion",
+        "logger",
+    )
 
     def __init__(self, sorted_dag: list[str], logger: logging.Logger) -> None:
         self.logger = logger
-        self._batches: dict[Snapshot, int] = {}
-        self._count: dict[Snapshot, int] = {}
-        self._complete_update_status: dict[str, bool] = {}
         self._sorted_dag = sorted_dag
+        self._name_to_index = {name: index for index, name in enumerate(sorted_dag)}
+        self._expected_batches = [0] * len(sorted_dag)
+        self._batch_count = [0] * len(sorted_dag)
+        self._complete = [False] * len(sorted_dag)
+        self._update_status = [False] * len(sorted_dag)
         self._current_index = 0
         self.finished_promotion = False
 
     def init_complete_update_status(self, snapshots: list[SnapshotTableInfo]) -> None:
-        planned_model_names = set()
-        for snapshot in snapshots:
-            planned_model_names.add(snapshot.name)
+        planned_model_names = {snapshot.name for snapshot in snapshots}
 
         # Anything not in the plan should be listed as completed and queued for
         # notification
-        self._complete_update_status = {
-            name: False for name in (set(self._sorted_dag) - planned_model_names)
-        }
+        self._complete = [name not in planned_model_names for name in self._sorted_dag]
+        self._update_status = [False] * len(self._sorted_dag)
 
     def update_promotion(self, snapshot: SnapshotInfoLike, promoted: bool) -> None:
-        self._complete_update_status[snapshot.name] = promoted
+        index = self._name_to_index.get(snapshot.name)
+        # Anything outside of the dag is never notified
+        if index is None:
+            return
+        self._complete[index] = True
+        self._update_status[index] = promoted
 
     def stop_promotion(self) -> None:
         self.finished_promotion = True
 
     def plan(self, batches: dict[Snapshot, int]) -> None:
-        self._batches = batches
-        self._count: dict[Snapshot, int] = {}
+        self._expected_batches = [0] * len(self._sorted_dag)
+        self._batch_count = [0] * len(self._sorted_dag)
 
-        for snapshot, _ in self._batches.items():
-            self._count[snapshot] = 0
+        for snapshot, count in batches.items():
+            self._expected_batches[self._name_to_index[snapshot.name]] = count
 
     def update_plan(self, snapshot: Snapshot, _batch_idx: int) -> tuple[int, int]:
-        self._count[snapshot] += 1
-        current_count = self._count[snapshot]
-        expected_count = self._batches[snapshot]
-        return (current_count, expected_count)
+        index = self._name_to_index[snapshot.name]
+        self._batch_count[index] += 1
+        return (self._batch_count[index], self._expected_batches[index])
 
     def notify_queue_next(self) -> tuple[str, bool] | None:
-        if self._current_index >= len(self._sorted_dag):
+        index = self._current_index
+        if index >= len(self._sorted_dag):
             return None
-        check_name = self._sorted_dag[self._current_index]
-        if check_name in self._complete_update_status:
+        if self._complete[index]:
             self._current_index += 1
-            return (check_name, self._complete_update_status[check_name])
+            return (self._sorted_dag[index], self._update_status[index])
         return None
 
+    def drain_ready(self) -> t.Iterator[tuple[str, bool]]:
+        """Yields every model that can be notified, in dag order, stopping at
+        the first model that hasn't completed."""
+        sorted_dag = self._sorted_dag
+        complete = self._complete
+        update_status = self._update_status
+        index = self._current_index
+        while index < len(sorted_dag) and complete[index]:
+            index += 1
+            self._current_index = index
+            yield (sorted_dag[index - 1], update_status[index - 1])
+
 
 class SQLMeshEventLogContext:
+    __slots__ = ("_event", "_handler")
+
     def __init__(
         self,
         handler: "DagsterSQLMeshEventHandler",
@@ -135,6 +167,17 @@ class PlanOrRunFailedError(Exception):
 
 
 class DagsterSQLMeshEventHandler:
+    __slots__ = (
+        "_context",
+        "_errors",
+        "_is_testing",
+        "_logger",
+        "_models_map",
+        "_prefix",
+        "_stage",
+        "_tracker",
+    )
+
     def __init__(
         self,
         context: AssetExecutionContext,
@@ -158,26 +201,19 @@ class DagsterSQLMeshEventHandler:
     def notify_success(
         self, sqlmesh_context: SQLMeshContext
     ) -> t.Iterator[MaterializeResult]:
-        notify = self._tracker.notify_queue_next()
-        while notify is not None:
-            completed_name, update_status = notify
-
-            # If the model is not in the context, we can skip any notification
-            # This will happen for external models
-            if not sqlmesh_context.get_model(completed_name):
-                notify = self._tracker.notify_queue_next()
-                continue
-
-            model = self._models_map.get(completed_name)
-
+        for completed_name, update_status in self._tracker.drain_ready():
             # We allow selecting models. That value is mapped to models_map.
-            # If the model is not in models_map, we can skip any notification
+            # If the model is not in models_map, we can skip any notification.
+            # models_map only contains models from the sqlmesh context so this
+            # also skips anything in the dag that isn't a model in the context.
+            model = self._models_map.get(completed_name)
             if model:
-                output_key = sqlmesh_model_name_to_key(model.name)
                 if not self._is_testing:
                     # Stupidly dagster when testing cannot use the following
                     # method so we must specifically skip this when testing
-                    asset_key = self._context.asset_key_for_output(output_key)
+                    asset_key = self._context.asset_key_for_output(
+                        sqlmesh_model_name_to_key(model.name)
+                    )
                     yield MaterializeResult(
                         asset_key=asset_key,
                         metadata={
@@ -185,46 +221,52 @@ class DagsterSQLMeshEventHandler:
                             "duration_ms": 0,
                         },
                     )
-            notify = self._tracker.notify_queue_next()
 
     def report_event(self, event: console.ConsoleEvent) -> None:
-        log_context = self.log_context(event)
-
         match event:
             case console.StartPlanEvaluation(plan=plan):
                 self._tracker.init_complete_update_status(plan.environment.snapshots)
-                log_context.info(
+                self._log_event(
+                    event,
+                    "info",
                     "Starting Plan Evaluation",
                     {
                         "plan": plan,
                     },
                 )
-            case console.StopPlanEvaluation:
-                log_context.info("Plan evaluation completed")
+            case console.StopPlanEvaluation():
+                self._log_event(event, "info", "Plan evaluation completed")
             case console.StartEvaluationProgress(
                 batched_intervals=batches,
                 environment_naming_info=environment_naming_info,
                 default_catalog=default_catalog,
             ):
                 self.update_stage("run")
-                log_context.info(
-                    "Starting Run",
-                    {
-                        "default_catalog": default_catalog,
-                        "environment_naming_info": environment_naming_info,
-                        "backfill_queue": {
-                            snapshot.model.name: count
-                            for snapshot, count in batches.items()
+                # The backfill queue is as large as the plan, so only build it
+                # when the record will actually be emitted.
+                if self._logger.isEnabledFor(logging.INFO):
+                    self._log_event(
+                        event,
+                        "info",
+                        "Starting Run",
+                        {
+                            "default_catalog": default_catalog,
+                            "environment_naming_info": environment_naming_info,
+                            "backfill_queue": {
+                                snapshot.model.name: count
+                                for snapshot, count in batches.items()
+                            },
                         },
-                    },
-                )
+                    )
                 self._tracker.plan(batches)
             case console.UpdateSnapshotEvaluationProgress(
                 snapshot=snapshot, batch_idx=batch_idx, duration_ms=duration_ms
             ):
                 done, expected = self._tracker.update_plan(snapshot, batch_idx)
 
-                log_context.info(
+                self._log_event(
+                    event,
+                    "info",
                     "Snapshot progress update",
                     {
                         "asset_key": sqlmesh_model_name_to_key(snapshot.model.name),
@@ -235,11 +277,13 @@ class DagsterSQLMeshEventHandler:
             case console.LogSuccess(success=success):
                 self.update_stage("done")
                 if success:
-                    log_context.info("sqlmesh ran successfully")
+                    self._log_event(event, "info", "sqlmesh ran successfully")
                 else:
-                    log_context.error("sqlmesh failed. check collected errors")
+                    self._log_event(event, "error", "sqlmesh failed. check collected errors")
             case console.LogError(message=message):
-                log_context.error(
+                self._log_event(
+                    event,
+                    "error",
                     f"sqlmesh reported an error: {message}",
                 )
                 self._errors.append(GenericSQLMeshError(message))
@@ -248,13 +292,15 @@ class DagsterSQLMeshEventHandler:
                     failed_models = "\n".join(
                         [f"{error.node!s}\n{error.__cause__!s}" for error in errors]
                     )
-                    log_context.error(f"sqlmesh failed models: {failed_models}")
+                    self._log_event(event, "error", f"sqlmesh failed models: {failed_models}")
                     for error in errors:
                         self._errors.append(
                             FailedModelError(error.node, str(error.__cause__))
                         )
             case console.UpdatePromotionProgress(snapshot=snapshot, promoted=promoted):
-                log_context.info(
+                self._log_event(
+                    event,
+                    "info",
                     "Promotion progress update",
                     {
                         "snapshot": snapshot.name,
@@ -265,15 +311,26 @@ class DagsterSQLMeshEventHandler:
             case console.StopPromotionProgress(success=success):
                 self._tracker.stop_promotion()
                 if success:
-                    log_context.info("Promotion completed successfully")
+                    self._log_event(event, "info", "Promotion completed successfully")
                 else:
-                    log_context.error("Promotion failed")
+                    self._log_event(event, "error", "Promotion failed")
             case _:
-                log_context.debug("Received event")
+                self._log_event(event, "debug", "Received event")
 
     def log_context(self, event: console.ConsoleEvent) -> SQLMeshEventLogContext:
         return SQLMeshEventLogContext(self, event)
 
+    def _log_event(
+        self,
+        event: console.ConsoleEvent,
+        level: str | int,
+        message: str,
+        obj: dict[str, t.Any] | None = None,
+    ) -> None:
+        """Logs a message for an event. This is equivalent to using
+        `log_context` but avoids allocating a log context for every event."""
+        self.log(level, message, {**(obj or {}), "_event_type": event.__class__.__name__})
+
     def log(
         self,
         level: str | int,
@@ -284,10 +341,7 @@ class DagsterSQLMeshEventHandler:
             self._logger.error(message)
             return
 
-        obj = obj or {}
-        final_obj = obj.copy()
-        final_obj["message"] = message
-        final_obj["_sqlmesh_stage"] = self._stage
+        final_obj = {**(obj or {}), "message": message, "_sqlmesh_stage": self._stage}
         self._logger.log(level, final_obj)
 
     def update_stage(self, stage: str):
@@ -333,10 +387,9 @@ class SQLMeshResource(ConfigurableResource):
             dag = mesh.models_dag()
 
             models = mesh.models()
-            models_map = models.copy()
-            all_available_models = set(
-                [model.fqn for model, _ in mesh.non_external_models_dag()]
-            )
+            all_available_models = {
+                model.fqn for model, _ in mesh.non_external_models_dag()
+            }
             selected_models_set, models_map, select_models = (
                 self._get_selected_models_from_context(context, models)
             )
@@ -365,7 +418,7 @@ class SQLMeshResource(ConfigurableResource):
                     plan_options=plan_options,
                     run_options=run_options,
                 ):
-                    logger.debug(f"sqlmesh event: {event}")
+                    logger.debug("sqlmesh event: %s", event)
                     event_handler.process_events(event)
             except SQLMeshError as e:
                 logger.error(f"sqlmesh error: {e}")
@@ -382,7 +435,6 @@ class SQLMeshResource(ConfigurableResource):
     def _get_selected_models_from_context(
         self, context: AssetExecutionContext, models: MappingProxyType[str, Model]
     ) -> tuple[set[str], dict[str, Model], list[str] | None]:
-        models_map = models.copy()
         try:
             selected_output_names = set(context.selected_output_names)
         except (DagsterInvalidPropertyError, AttributeError) as e:
@@ -390,16 +442,16 @@ class SQLMeshResource(ConfigurableResource):
             # https://github.com/dagster-io/dagster/issues/23633
             if "DirectOpExecutionContext" in str(e):
                 context.log.warning("Caught an error that is likely a direct execution")
-                return (set(models_map.keys()), models_map, None)
+                return (set(models.keys()), dict(models), None)
             else:
                 raise e
 
-        select_models: list[str] = []
-        models_map = {}
-        for key, model in models.items():
-            if sqlmesh_model_name_to_key(model.name) in selected_output_names:
-                models_map[key] = model
-                select_models.append(model.name)
+        models_map = {
+            key: model
+            for key, model in models.items()
+            if sqlmesh_model_name_to_key(model.name) in selected_output_names
+        }
+        select_models = [model.name for model in models_map.values()]
         return (
             set(models_map.keys()),
             models_map,
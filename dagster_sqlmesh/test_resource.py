@@ -1,6 +1,10 @@
+import logging
+import typing as t
+from dataclasses import dataclass
+
 import dagster as dg
 
-from dagster_sqlmesh.resource import PlanOrRunFailedError
+from dagster_sqlmesh.resource import MaterializationTracker, PlanOrRunFailedError
 from dagster_sqlmesh.testing import setup_testing_sqlmesh_test_context
 
 
@@ -13,11 +17,14 @@ def test_sqlmesh_resource_should_report_no_errors(
         project_path=sample_sqlmesh_project,
         variables={"enable_model_failure": False}
     )
-    test_context.initialize_test_source()
-    resource = test_context.create_resource()
+    try:
+        test_context.initialize_test_source()
+        resource = test_context.create_resource()
 
-    for result in resource.run(dg_context):
-        pass
+        for result in resource.run(dg_context):
+            pass
+    finally:
+        test_context.close()
 
 
 def test_sqlmesh_resource_properly_reports_errors(
@@ -29,22 +36,71 @@ def test_sqlmesh_resource_properly_reports_errors(
         project_path=sample_sqlmesh_project,
         variables={"enable_model_failure": True}
     )
-    test_context.initialize_test_source()
-    resource = test_context.create_resource()
-
-    caught_failure = False
     try:
-        for result in resource.run(dg_context):
-            pass
-    except PlanOrRunFailedError as e:
-        caught_failure = True
-
-        expected_error_found = False
-        for err in e.errors:
-            if "staging_model_5" in str(err):
-                expected_error_found = True
-                break
-        assert expected_error_found, "Expected error not found in the error list."
-    
+        test_context.initialize_test_source()
+        resource = test_context.create_resource()
+
+        caught_failure = False
+        try:
+            for result in resource.run(dg_context):
+                pass
+        except PlanOrRunFailedError as e:
+            caught_failure = True
+
+            expected_error_found = False
+            for err in e.errors:
+                if "staging_model_5" in str(err):
+                    expected_error_found = True
+                    break
+            assert expected_error_found, "Expected error not found in the error list."
+    finally:
+        test_context.close()
+
     assert caught_failure, "Expected an error to be raised, but it was not."
 
+
+@dataclass(frozen=True)
+class FakeSnapshot:
+    name: str
+
+
+def _fake_snapshot(name: str) -> t.Any:
+    return FakeSnapshot(name=name)
+
+
+def test_materialization_tracker_notifies_in_dag_order():
+    tracker = MaterializationTracker(["a", "b", "c", "d"], logging.getLogger(__name__))
+    # "a" and "d" are not in the plan so they are complete immediately
+    tracker.init_complete_update_status([_fake_snapshot("b"), _fake_snapshot("c")])
+
+    b = _fake_snapshot("b")
+    tracker.plan({b: 2})
+    assert tracker.update_plan(b, 0) == (1, 2)
+    assert tracker.update_plan(b, 1) == (2, 2)
+
+    assert tracker.notify_queue_next() == ("a", False)
+    assert tracker.notify_queue_next() is None
+
+    # "c" completes before "b" but is only notified after "b"
+    tracker.update_promotion(_fake_snapshot("c"), True)
+    assert tracker.notify_queue_next() is None
+    tracker.update_promotion(_fake_snapshot("b"), True)
+    # Models outside of the dag are ignored
+    tracker.update_promotion(_fake_snapshot("external"), True)
+
+    assert tracker.notify_queue_next() == ("b", True)
+    assert tracker.notify_queue_next() == ("c", True)
+    assert tracker.notify_queue_next() == ("d", False)
+    assert tracker.notify_queue_next() is None
+
+
+def test_materialization_tracker_drain_ready_stops_at_incomplete_model():
+    tracker = MaterializationTracker(["a", "b", "c"], logging.getLogger(__name__))
+    tracker.init_complete_update_status([_fake_snapshot("b")])
+
+    assert list(tracker.drain_ready()) == [("a", False)]
+    assert list(tracker.drain_ready()) == []
+
+    tracker.update_promotion(_fake_snapshot("b"), True)
+    assert list(tracker.drain_ready()) == [("b", True), ("c", False)]
+    assert tracker.notify_queue_next() is None
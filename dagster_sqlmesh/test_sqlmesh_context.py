@@ -2,6 +2,7 @@ import logging
 
 import polars
 
+from .controller import PlanOptions, RunOptions
 from .testing import SQLMeshTestContext
 
 logger = logging.getLogger(__name__)
@@ -156,16 +157,18 @@ def test_restating_models(sample_sqlmesh_test_context: SQLMeshTestContext):
     """
     )
 
-    # Restate the model for the month of March
-    sample_sqlmesh_test_context.plan_and_run(
-        environment="dev",
+    # Restate the model for the month of March. This goes through the threaded
+    # plan_and_run that the dagster resource uses.
+    for _ in sample_sqlmesh_test_context.controller.plan_and_run(
+        "dev",
         start="2023-03-01",
         end="2023-03-31",
-        execution_time="2024-01-02",
         select_models=["sqlmesh_example.staging_model_4"],
         restate_selected=True,
         skip_run=True,
-    )
+        plan_options=PlanOptions(enable_preview=True, execution_time="2024-01-02"),
+    ):
+        pass
 
     # Check that the sum of values for February and March are the same
     feb_sum_query_restate = sample_sqlmesh_test_context.query(
@@ -193,3 +196,27 @@ def test_restating_models(sample_sqlmesh_test_context: SQLMeshTestContext):
     assert (
         intermediate_2_query_restate[0][0] == intermediate_2_query[0][0]
     ), "Intermediate model should not change during restate"
+
+
+def test_plan_and_run_options_can_be_reused(
+    sample_sqlmesh_test_context: SQLMeshTestContext,
+):
+    controller = sample_sqlmesh_test_context.create_controller()
+    plan_options = PlanOptions(enable_preview=True)
+    run_options = RunOptions()
+
+    for _ in range(2):
+        for _ in controller.plan_and_run(
+            "dev",
+            start="2023-01-01",
+            end="2024-01-01",
+            plan_options=plan_options,
+            run_options=run_options,
+        ):
+            pass
+        # The plan's auto-apply handler must not outlive the call, otherwise
+        # the next plan would be applied once per leftover handler
+        assert controller.console._handlers == {}
+
+    assert plan_options == PlanOptions(enable_preview=True)
+    assert run_options == RunOptions()
@@ -1,6 +1,7 @@
+import functools
 import logging
 import typing as t
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import duckdb
 import polars
@@ -55,50 +56,67 @@ class SQLMeshTestContext:
 
     db_path: str
     context_config: SQLMeshContextConfig
+    _conn: duckdb.DuckDBPyConnection | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def conn(self) -> duckdb.DuckDBPyConnection:
+        """A lazily created duckdb connection that is reused for the lifetime
+        of this test context. DuckDB connections are not thread safe so this
+        should only be used from the thread running the test."""
+        self._conn = self._conn or duckdb.connect(self.db_path)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def create_controller(self) -> DagsterSQLMeshController[Context]:
         return DagsterSQLMeshController.setup_with_config(
             config=self.context_config, 
         )
 
+    @functools.cached_property
+    def controller(self) -> DagsterSQLMeshController[Context]:
+        """A controller shared by every `plan_and_run` call on this test
+        context so that each call doesn't set up a new controller and
+        EventConsole. The sqlmesh context is still opened per call."""
+        return self.create_controller()
+
     def create_resource(self) -> SQLMeshResource:
         return SQLMeshResource(
             config=self.context_config, is_testing=True,
         )
 
     def query(self, *args: t.Any, **kwargs: t.Any) -> list[t.Any]:
-        conn = duckdb.connect(self.db_path)
-        return conn.sql(*args, **kwargs).fetchall()
+        return self.conn.sql(*args, **kwargs).fetchall()
 
     def initialize_test_source(self) -> None:
-        conn = duckdb.connect(self.db_path)
-        conn.sql(
+        self.conn.execute(
             """
         CREATE SCHEMA sources;
-        """
-        )
-        conn.sql(
-            """
         CREATE TABLE sources.test_source (id INTEGER, name VARCHAR);
-        """
-        )
-        conn.sql(
-            """
         INSERT INTO sources.test_source (id, name)
         VALUES (1, 'abc'), (2, 'def');
         """
         )
-        conn.close()
 
     def append_to_test_source(self, df: polars.DataFrame):
         logger.debug("appending data to the test source")
-        conn = duckdb.connect(self.db_path)
-        conn.sql(
+        # Register the arrow table explicitly so duckdb can scan it without
+        # copying or searching the caller's frame for `df`
+        self.conn.register("test_source_append", df.to_arrow())
+        try:
+            self.conn.execute(
+                """
+            INSERT INTO sources.test_source 
+            SELECT * FROM test_source_append 
             """
-        INSERT INTO sources.test_source 
-        SELECT * FROM df 
-        """
-        )
+            )
+        finally:
+            self.conn.unregister("test_source_append")
 
     def plan_and_run(
         self,
@@ -116,21 +134,21 @@ class SQLMeshTestContext:
         Args:
             environment (str): The environment to run SQLMesh in.
             execution_time (TimeLike, optional): The execution timestamp for the run. Defaults to None.
-            enable_debug_console (bool, optional): Flag to enable debug console. Defaults to False.
             start (TimeLike, optional): Start time for the run interval. Defaults to None.
             end (TimeLike, optional): End time for the run interval. Defaults to None.
-            restate_models (List[str], optional): List of models to restate. Defaults to None.
+            select_models (List[str], optional): List of models to plan and run. Defaults to None.
+            restate_selected (bool, optional): Restate the selected models. Defaults to False.
+            skip_run (bool, optional): Only run the plan. Defaults to False.
 
         Returns:
-            None: The function records events to a debug console but doesn't return anything.
+            None: The function records events to a console recorder but doesn't return anything.
 
         Note:
             TimeLike can be any time-like object that SQLMesh accepts (datetime, str, etc.).
-            The function creates a controller and recorder to capture all SQLMesh events during execution.
+            The function uses the shared `controller` and a new recorder to capture all SQLMesh events during execution.
         """
-        controller = self.create_controller()
+        controller = self.controller
         recorder = ConsoleRecorder()
-        # controller.add_event_handler(ConsoleRecorder())
         plan_options = PlanOptions(
             enable_preview=True,
         )
@@ -139,14 +157,16 @@ class SQLMeshTestContext:
             plan_options["execution_time"] = execution_time
             run_options["execution_time"] = execution_time
 
-        for event in controller.plan_and_run(
-            environment,
-            start=start,
-            end=end,
-            select_models=select_models,
-            restate_selected=restate_selected,
-            plan_options=plan_options,
-            run_options=run_options,
-            skip_run=skip_run,
-        ):
-            recorder(event)
+        # The recorder never needs to act on events while sqlmesh is running so
+        # there's no need to run sqlmesh in a separate thread
+        with controller.instance(environment, "plan_and_run") as mesh:
+            mesh.plan_and_run_sync(
+                recorder,
+                start=start,
+                end=end,
+                select_models=select_models,
+                restate_selected=restate_selected,
+                plan_options=plan_options,
+                run_options=run_options,
+                skip_run=skip_run,
+            )
@@ -8,7 +8,7 @@ from sqlmesh.core.model import Model
 MultiAssetResponse = t.Iterable[AssetCheckResult | AssetMaterialization]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class SQLMeshParsedFQN:
     catalog: str
     schema: str
@@ -16,14 +16,12 @@ class SQLMeshParsedFQN:
 
     @classmethod
     def parse(cls, fqn: str) -> "SQLMeshParsedFQN":
-        split_fqn = fqn.split(".")
-
-        # Remove any quotes
-        split_fqn = list(map(lambda a: a.strip("'\""), split_fqn))
+        # Remove any quotes around each part
+        split_fqn = [part.strip("'\"") for part in fqn.split(".")]
         return cls(catalog=split_fqn[0], schema=split_fqn[1], view_name=split_fqn[2])
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class SQLMeshModelDep:
     fqn: str
     model: Model | None = None
@@ -1,6 +1,11 @@
+import functools
+
 from sqlmesh.core.snapshot import SnapshotId
 
 
+# Model names are bounded by the size of the sqlmesh project and this is called
+# for every snapshot progress update so the results are cached
+@functools.cache
 def sqlmesh_model_name_to_key(name: str) -> str:
     return name.replace(".", "_dot__")
 